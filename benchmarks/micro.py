@@ -0,0 +1,216 @@
+""" Micro-benchmarks das funções mais usadas pelo jogador, pelo jogo e pelo torneio.
+
+Cada função é medida isoladamente, em cada idioma, com históricos fixos e representativos:
+- "inicio": primeira tentativa, sobre o dicionário inteiro do idioma;
+- "final": últimas tentativas, sobre o conjunto pequeno de palavras que ainda restam.
+
+Para cada caso são exibidos o número de operações por segundo (melhor de algumas repetições) e o
+pico de memória alocada em uma chamada (medido com `tracemalloc`).
+
+Como o número de operações por segundo depende da máquina, a velocidade de cada caso é comparada de
+forma relativa: ela é dividida pela de um laço de calibração em Python puro (que não usa o código do
+jogo), medido no mesmo processo e intercalado com as repetições do caso, para que variações de
+velocidade da máquina durante a execução afetem os dois igualmente. Os resultados são comparados com os salvos em 'baseline.json': se
+algum caso ficar relativamente mais lento ou alocar mais memória do que o limite de tolerância, o
+benchmark falha (código de saída 1).
+
+Uso básico:
+    python benchmarks/micro.py                     (compara com a linha de base)
+    python benchmarks/micro.py --lang pt           (apenas um idioma)
+    python benchmarks/micro.py --save              (salva os resultados como nova linha de base)
+    python benchmarks/micro.py --threshold 0.25    (tolera até 25% de regressão)
+"""
+
+# Bibliotecas necessárias
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))   # Raiz do repositório
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Os módulos do jogo abrem os arquivos de palavras relativos à raiz do repositório
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import game
+import player
+import tournament
+import utils
+
+# Históricos fixos de cada idioma: palavra secreta e palpites feitos, do primeiro ao último antes do acerto
+HISTORIES = {
+    "pt": ("VIGAS", ["CORAS", "MELAS", "GATAS"]),
+    "en": ("CRUDE", ["BONES", "TRACE"]),
+    "fr": ("LOYAL", ["FOLIE"]),
+    "it": ("MITRA", ["SARTO"]),
+    "sp": ("PERRO", ["CANTO", "DUELO"]),
+}
+
+MIN_TIME = 0.1      # Tempo mínimo, em segundos, de cada repetição de um caso
+REPEAT = 7          # Número de repetições de cada caso (vale a mais rápida)
+
+# Palavras do laço de calibração (fixas, independentes dos dicionários)
+CALIBRATION_WORDS = ["CORAS", "MELAS", "GATAS", "BONES", "TRACE", "FOLIE", "SARTO", "CANTO", "DUELO", "VIGAS"]
+
+def calibration():
+    """ Laço de calibração: operações típicas do jogador (contagens em dicionários, conjuntos e
+    comparações de letras) em Python puro, sem usar o código do jogo. """
+    counts = {}
+    matches = 0
+    for guess in CALIBRATION_WORDS:
+        for word in CALIBRATION_WORDS:
+            matches += sum(1 for i in range(5) if guess[i] == word[i])
+            for letter in set(word):
+                counts[letter] = counts.get(letter, 0) + 1
+    return matches, sorted(counts.items())
+
+def prepare(lang):
+    """ Prepara os argumentos de cada caso do idioma 'lang'.
+
+    Retorna
+        dict: Para cada nome de caso, a função a ser medida (sem argumentos).
+    """
+    secret, guesses = HISTORIES[lang]
+    utils.set_language(lang)
+    words = tournament.get_words(lang)
+    player.reset()
+    valid_words = player.VALID_WORDS
+
+    results = [tournament.feedback(guess, secret, words) for guess in guesses]
+
+    # Conjunto de palavras possíveis antes do último palpite do histórico e depois dele
+    before_last = valid_words
+    for i in range(len(guesses) - 1):
+        before_last = player.get_filtered_words(before_last, guesses[:i + 1], results[:i + 1])
+    remaining = player.get_filtered_words(before_last, guesses, results)
+
+    # Estado usado por get_distinct_word(), como em get_next_word()
+    red_indexes = [i for i, color in enumerate(results[-1]) if color == "RED"]
+    letters_to_try = {word[i] for i in red_indexes for word in remaining}
+
+    # O jogo é preparado sem janela e com a palavra secreta fixa
+    game.setup(["--lang", lang])
+    game.CODE = secret
+
+    def load_words():
+        utils.dicts.pop(lang, None)
+        utils.load_words(lang)
+
+    def distinct_word():
+        player.letters_to_try = letters_to_try
+        player.get_distinct_word(guesses[-1], red_indexes)
+
+    def check_word():
+        # Mantém a grade e o histórico do jogo com uma única tentativa
+        del game.grid[1:], game.colors[1:]
+        game.history_guesses.clear(), game.history_results.clear(), game.history_times.clear()
+        game.win = False
+        game.check_word(guesses[-1])
+
+    return {
+        "load_words": load_words,
+        "get_filtered_words/inicio": lambda: player.get_filtered_words(valid_words, guesses[:1], results[:1]),
+        "get_filtered_words/final": lambda: player.get_filtered_words(before_last, guesses, results),
+        "get_best_word/inicio": lambda: player.get_best_word(valid_words),
+        "get_best_word/final": lambda: player.get_best_word(remaining),
+        "get_distinct_word/final": distinct_word,
+        "feedback": lambda: tournament.feedback(guesses[-1], secret, words),
+        "check_word": check_word,
+    }
+
+def rate(function):
+    """ Retorna o número de chamadas por segundo da função 'function', chamada por ao menos MIN_TIME segundos. """
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        function()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_TIME:
+            return calls / elapsed
+
+def measure(function):
+    """ Mede a função 'function', intercalando cada repetição com uma do laço de calibração.
+
+    Retorna
+        tuple: Operações por segundo (melhor repetição), operações por segundo relativas às da
+        calibração (mediana das repetições) e pico de memória de uma chamada, em KiB.
+    """
+    function()          # Aquecimento (caches, importações tardias)
+
+    best = 0.0
+    ratios = []
+    for _ in range(REPEAT):
+        ops = rate(function)
+        ratios.append(ops / rate(calibration))
+        best = max(best, ops)
+    ratios.sort()
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, ratios[len(ratios) // 2], (peak - base) / 1024
+
+def parse_arguments():
+    """Configura o argparse para receber as opções do benchmark."""
+    parser = argparse.ArgumentParser(description="Micro-benchmarks das funções mais usadas do jogo.")
+    parser.add_argument("--lang", type=str, nargs="+", choices=list(HISTORIES), default=list(HISTORIES),
+                        help="Idiomas medidos. Padrão: todos.")
+    parser.add_argument("--save", action="store_true", help="Salva os resultados como nova linha de base.")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="Regressão máxima tolerada em relação à linha de base (0.5 = 50%%). Padrão: 0.5.")
+    return parser.parse_args()
+
+def main():
+    """ Função principal do benchmark. """
+    args = parse_arguments()
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    results = {}
+    regressions = []
+    print(f"{'Caso':<32} {'ops/s':>12} {'relativo':>10} {'base rel.':>10} {'pico (KiB)':>11} {'base (KiB)':>11}")
+    for lang in args.lang:
+        for name, function in prepare(lang).items():
+            case = f"{lang}/{name}"
+            ops, relative, peak = measure(function)
+            results[case] = {"ops": round(ops, 1), "relative": round(relative, 6), "peak_kib": round(peak, 1)}
+
+            old = baseline.get(case)
+            if old is not None and "relative" not in old:
+                old = None          # Linha de base antiga, sem velocidade relativa: não é comparada
+            flag = ""
+            if old is not None and not args.save:
+                # Pequenas alocações (até 1 KiB) variam entre execuções e são ignoradas
+                if relative < old["relative"] * (1 - args.threshold):
+                    flag += " LENTO"
+                if peak > max(old["peak_kib"] * (1 + args.threshold), 1.0):
+                    flag += " MEMÓRIA"
+                if flag:
+                    regressions.append(case)
+
+            print(f"{case:<32} {ops:>12.1f} {relative:>10.4f} {old['relative'] if old else '-':>10} "
+                  f"{peak:>11.1f} {old['peak_kib'] if old else '-':>11}{flag}")
+
+    if args.save:
+        baseline.update(results)
+        with open(BASELINE, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"\nLinha de base salva em {BASELINE}")
+    elif regressions:
+        print(f"\nRegressões acima de {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+""" Benchmark do tempo de inicialização a frio dos módulos do jogo.
+
+Cada medição roda um novo interpretador Python (como um usuário iniciando o jogo ou o torneio),
+a partir da raiz do repositório, e mede o tempo total do processo. São medidos:
+- a importação de `player`, `game` e `tournament` (que não devem carregar dicionários nem
+  importar o Pygame ou o Tqdm);
+- o primeiro palpite do jogador em cada idioma (que carrega apenas o dicionário do idioma).
+
+O tempo de um interpretador vazio também é medido, como referência.
+
+Uso básico:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --repeat 20 --max-ms 500
+"""
+
+# Bibliotecas necessárias
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))   # Raiz do repositório
+
+# Trechos de código medidos, cada um em um novo interpretador
+CASES = {
+    "python (vazio)": "pass",
+    "import player": "import player",
+    "import game": "import game",
+    "import tournament": "import tournament",
+}
+for lang in ["pt", "en", "fr", "it", "sp"]:
+    CASES[f"1º palpite ({lang})"] = f"import utils, player; utils.set_language('{lang}'); player.player([], [])"
+
+def measure(code, repeat):
+    """ Roda 'code' em 'repeat' novos interpretadores e retorna o tempo de cada execução, em milissegundos. """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+def parse_arguments():
+    """Configura o argparse para receber as opções do benchmark."""
+    parser = argparse.ArgumentParser(description="Mede o tempo de inicialização a frio dos módulos do jogo.")
+    parser.add_argument("--repeat", type=int, default=10, help="Número de execuções de cada caso. Padrão: 10.")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Tempo máximo (mediana, em ms) aceito para cada caso; acima dele, o benchmark falha.")
+    return parser.parse_args()
+
+def main():
+    """ Função principal do benchmark. """
+    args = parse_arguments()
+
+    # Garante que os índices de palavras já existam, para medir apenas a inicialização
+    measure("import word_index; [word_index.open_index(lang) for lang in ['pt', 'en', 'fr', 'it', 'sp']]", 1)
+
+    failed = []
+    print(f"{'Caso':<22} {'Mínimo (ms)':>12} {'Mediana (ms)':>13}")
+    for name, code in CASES.items():
+        times = measure(code, args.repeat)
+        median = statistics.median(times)
+        print(f"{name:<22} {min(times):>12.1f} {median:>13.1f}")
+        if args.max_ms is not None and median > args.max_ms:
+            failed.append(name)
+
+    if failed:
+        print(f"\nAcima de {args.max_ms} ms: {', '.join(failed)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
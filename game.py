@@ -27,20 +27,19 @@
 
 
 # Bibliotecas necessárias
-from utils import ALL_COLORS, choose_secret_word, load_words, set_language
+from utils import ALL_COLORS, choose_adversarial_result, choose_secret_word, set_language
+from word_index import open_index
+from replay import append_game
+from player import player
 import argparse
 import sys
+import time
 
-# Verificar se o Pygame está instalado, caso contrário, exibir mensagem de erro e encerrar o programa.
-try:
-    import pygame
-except ImportError:
-    print(
-        "Pygame não foi instalado. Por favor, cheque o README para mais informações ou consulte um monitor."
-    )
-    exit(1)
+# O Pygame só é importado ao abrir a janela do jogo (ver `init_display`), para que
+# o módulo possa ser importado (por exemplo, por benchmarks) sem a interface gráfica.
+pygame = None
 
-def parse_arguments():
+def parse_arguments(argv=None):
     """Configura o argparse para receber o idioma do dicionário e o modo do jogo."""
     parser = argparse.ArgumentParser(
         description=(
@@ -48,6 +47,8 @@ def parse_arguments():
             "Uso básico:\n"
             "  python game.py --lang pt                (Modo manual em português)\n"
             "  python game.py --lang en --auto         (Modo automático em inglês)\n"
+            "  python game.py --auto --log jogos.log   (Registra a partida para reprodução com replay.py)\n"
+            "  python game.py --auto --adversarial     (Modo adversário, estilo Absurdle)\n"
         ),
         formatter_class=argparse.RawTextHelpFormatter
     )
@@ -68,15 +69,27 @@ def parse_arguments():
         help="Ativa o modo automático do jogo. Caso omitido, o modo manual será utilizado."
     )
     
+    # Argumento booleano para o modo adversário
+    parser.add_argument(
+        "--adversarial", 
+        action="store_true", 
+        help="Ativa o modo adversário (estilo Absurdle): após cada palpite, o jogo mantém o maior grupo de \npalavras secretas possíveis com o mesmo feedback, prolongando a partida ao máximo."
+    )
+    
+    # Argumento para o arquivo de registro de partidas
+    parser.add_argument(
+        "--log", 
+        type=str, 
+        default=None, 
+        help="Arquivo em que a partida é acrescentada ao final, quando vencida no modo automático (ver replay.py)."
+    )
+    
     # Exibe a ajuda e encerra o programa se não houver argumentos válidos
     if len(sys.argv) == 0:
         parser.print_help()
         sys.exit(1)
     
-    return parser.parse_args() 
-
-# Chama a função para analisar os argumentos de linha de comando
-args = parse_arguments()                                
+    return parser.parse_args(argv) 
 
 # Constantes do jogo
 WIDTH, HEIGHT = 400, 500                                # Largura e altura da tela
@@ -84,11 +97,15 @@ GRID_SIZE = 5                                           # Tamanho da matriz do j
 FONT_SIZE = 40                                          # Tamanho da fonte das letras
 CELL_SIZE = 50                                          # Tamanho da célula da matriz para desenhar na tela
 MARGIN = 10                                             # Margem entre as células que serão desenhadas na tela
-set_language(args.lang)                                 # Define o idioma do dicionário com base no argumento passado
-WORDS = load_words(lang = args.lang)                    # Carrega todas as palavras do arquivo do idioma escolhido
-CODE = choose_secret_word(WORDS)                        # Palavra secreta escolhida pelo computador com base na lista de palavras do idioma selecionado
-CUSTOM_TIMER_EVENT = pygame.USEREVENT + 1               # Evento customizado para pausar o jogo
-from player import player
+
+# Definidas por `setup` e `init_display`, apenas quando o jogo é iniciado
+args = None                                             # Argumentos de linha de comando
+WORDS = None                                            # Índice com as palavras de 5 letras do idioma escolhido
+CODE = None                                             # Palavra secreta escolhida pelo computador
+CANDIDATES = None                                       # Palavras secretas ainda possíveis (apenas no modo adversário)
+CUSTOM_TIMER_EVENT = None                               # Evento customizado para pausar o jogo
+SCREEN = None                                           # Janela do jogo
+font = None                                             # Fonte utilizada para desenhar as letras na tela
 
 # Inicialização das variáveis globais do jogo
 wait = 0                                                # Contador para esperar um tempo antes de automatizar a jogada
@@ -99,17 +116,52 @@ win = False                                             # Variável para control
 n_guesses = 0                                           # Número de tentativas do jogador
 history_guesses = []                                    # Histórico de palavras inseridas pelo jogador
 history_results = []                                    # Histórico de resultados (cores) das palavras inseridas pelo jogador
-
-# Criação da janela e definição do título
-pygame.init()                                           # Inicialização do Pygame
-SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))       # Criação da janela do jogo           
-pygame.display.set_caption("Adivinha a Palavra!")       # Título da janela
-font = pygame.font.Font(None, FONT_SIZE)                # Fonte utilizada para desenhar as letras na tela
+history_times = []                                      # Histórico de tempo gasto pelo player em cada palavra (0 no modo manual)
+guess_time = 0.0                                        # Tempo gasto pelo player na última palavra, em segundos
 
 # Inicialização das matrizes (5 colunas e a quantidade de linhas vai aumentando conforme as tentativas)
 colors = [[ALL_COLORS["DARK_GRAY"] for _ in range(GRID_SIZE)] for _ in range(attempts)]     # Matriz de cores para a grade inicial do jogo
 grid = [["" for _ in range(GRID_SIZE)] for _ in range(attempts)]                            # Matriz de letras para a grade inicial do jogo
 
+def setup(argv=None):
+    """ Prepara uma partida: lê os argumentos, define o idioma e escolhe a palavra secreta.
+    
+        Apenas o dicionário do idioma escolhido é carregado (ver `word_index.open_index`).
+        
+        Parâmetros:
+            argv (list): Argumentos de linha de comando (por padrão, os de `sys.argv`).
+    """
+    global args, WORDS, CODE, CANDIDATES
+    
+    args = parse_arguments(argv)                        # Analisa os argumentos de linha de comando
+    set_language(args.lang)                             # Define o idioma do dicionário com base no argumento passado
+    WORDS = open_index(args.lang)                       # Carrega as palavras de 5 letras do idioma escolhido
+    CODE = choose_secret_word(WORDS)                    # Palavra secreta escolhida pelo computador com base na lista de palavras do idioma selecionado
+    
+    # No modo adversário, a palavra secreta só é definida ao longo da partida (ver `check_word`)
+    if args.adversarial:
+        CANDIDATES = list(WORDS)
+
+def init_display():
+    """ Importa e inicializa o Pygame, cria a janela do jogo e define o título. """
+    global pygame, SCREEN, font, CUSTOM_TIMER_EVENT
+    
+    # Verificar se o Pygame está instalado, caso contrário, exibir mensagem de erro e encerrar o programa.
+    try:
+        import pygame
+    except ImportError:
+        print(
+            "Pygame não foi instalado. Por favor, cheque o README para mais informações ou consulte um monitor."
+        )
+        exit(1)
+    
+    # Criação da janela e definição do título
+    pygame.init()                                           # Inicialização do Pygame
+    SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))       # Criação da janela do jogo           
+    pygame.display.set_caption("Adivinha a Palavra!")       # Título da janela
+    font = pygame.font.Font(None, FONT_SIZE)                # Fonte utilizada para desenhar as letras na tela
+    CUSTOM_TIMER_EVENT = pygame.USEREVENT + 1               # Evento customizado para pausar o jogo
+
 def draw_grid(position):
     """ Função responsável por desenhar a grade do jogo na tela.
     
@@ -215,12 +267,15 @@ def auto_play():
     
         Chama a função do player, insere a palavra na grade e verifica se está correta
     """
-    global grid, colors, args
+    global grid, colors, args, guess_time
     
+    start = time.perf_counter()
     guess_player = player(history_guesses,history_results)          # Obtém a palavra do player
+    guess_time = time.perf_counter() - start                        # Tempo gasto pelo player
     # Verificar a flag "auto" para validar se o jogador é automático ou não
     if args.auto == False:
         guess_player = ""                                       # Se o jogo não for automático, a palavra é vazia
+        guess_time = 0.0                                        # e o tempo do player não é registrado
     write_guess(guess_player)                                   # Insere a palavra na grade
     check_word(guess_player)                                    # Verifica se a palavra está correta
 
@@ -234,7 +289,8 @@ def check_word(guess):
             list: Lista de cores correspondentes ao feedback de cada letra
     """
     
-    global win, attempts, n_guesses, grid, colors, history_guesses, history_results
+    global win, attempts, n_guesses, grid, colors, history_guesses, history_results, history_times, guess_time
+    global CODE, CANDIDATES
     
     # Converte a palavra para maíuscula se for uma string, caso contrário, retorna None
     if type(guess) == str:
@@ -245,12 +301,20 @@ def check_word(guess):
     # Se a palavra tem o tamanho correto e está na lista de palavras válidas, processa a jogada
     if len(guess) == GRID_SIZE and guess in WORDS:
         
+        # No modo adversário, mantém o maior grupo de palavras secretas com o mesmo feedback.
+        # Qualquer palavra do grupo produz esse feedback, então ela passa a ser a palavra secreta.
+        if args.adversarial:
+            _, CANDIDATES = choose_adversarial_result(guess, CANDIDATES)
+            CODE = CANDIDATES[0]
+        
         colors_result = ["DARK_GRAY" for _ in range(GRID_SIZE)]         # Inicializa a lista de cores com a cor padrão
         n_guesses += 1                                                  # Incrementa o número de tentativas
         
         # Se a palavra estiver correta, o jogador vence (ativa a flag "win")
         if guess == CODE:
             print(f"Você venceu em {n_guesses} chutes!")
+            if args.adversarial:
+                print(f"Tempo máximo do player por palpite: {1000 * max(history_times + [guess_time]):.2f} ms")
             win = True
             colors_result = ["GREEN" for _ in range(GRID_SIZE)]     # Marca todas as letras como corretas
             
@@ -288,6 +352,13 @@ def check_word(guess):
         # Adiciona a tentativa e seu respectivo resultado ao histórico do jogador
         history_guesses.append(guess)
         history_results.append(colors_result)
+        history_times.append(guess_time)
+        guess_time = 0.0
+        
+        # Registra a partida ao vencer, se solicitado. Apenas partidas do modo automático são registradas:
+        # as manuais não têm palpites nem tempos do player para comparar na reprodução
+        if win and args.auto and args.log is not None:
+            append_game(args.log, args.lang, CODE, history_guesses, history_results, history_times)
         
         return colors_result
 
@@ -411,4 +482,6 @@ def game():
 # Esse bloco garante que o jogo só será executado se este arquivo for rodado diretamente,
 # evitando sua execução caso seja importado como módulo em outro script.
 if __name__ == "__main__":
+    setup()
+    init_display()
     game()  
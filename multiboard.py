@@ -0,0 +1,169 @@
+# Jogador para variantes com vários tabuleiros simultâneos (como Quordle e Octordle),
+# em que cada palpite é comparado com 4 a 8 palavras secretas ao mesmo tempo.
+
+import time
+
+from player import PATTERN_COST, TIME_BUDGET, estimate_cost, get_anytime_word, get_ranked_words
+from utils import PATTERN_WIN, encode_result, get_pattern
+import player
+
+# Palavras possíveis de cada tabuleiro, filtradas a cada tentativa.
+# No início da partida, todos os tabuleiros compartilham a mesma lista
+# (as listas nunca são alteradas, apenas substituídas pelas filtradas).
+boards: list[list[str]] = []
+# Indica, para cada tabuleiro, se a sua palavra secreta já foi acertada
+solved: list[bool] = []
+# Cache, por idioma, do primeiro palpite: como todos os tabuleiros começam
+# com as mesmas palavras, ele não depende do número de tabuleiros
+first_guess_by_language: dict[str, str] = {}
+# Orçamento de tempo, em segundos, do primeiro palpite: como ele é calculado
+# uma única vez por idioma, pode avaliar muito mais palpites que os demais
+OPENING_BUDGET: float = 0.5
+
+# Custo estimado, em segundos, de contar uma palavra de um tabuleiro cujo
+# feedback já foi calculado (ver get_board_partitions())
+LOOKUP_COST: float = 1.5e-7
+
+
+def reset(n_boards: int) -> None:
+    """
+    Prepara o jogador para uma nova partida com `n_boards` tabuleiros,
+    no idioma atual de `utils`. O primeiro palpite do idioma é calculado
+    apenas na primeira partida em que ele é usado.
+    """
+    global boards, solved
+
+    # Carrega (com cache por idioma) as palavras de 5 letras do idioma
+    player.reset()
+
+    boards = [player.VALID_WORDS] * n_boards
+    solved = [False] * n_boards
+
+    if player.language not in first_guess_by_language:
+        first_guess_by_language[player.language] = get_multi_word([player.VALID_WORDS], OPENING_BUDGET)
+
+
+def get_board_partitions(guess: str, words_per_board: list[list[str]]) -> list[dict[int, int]]:
+    """
+    Retorna, para cada tabuleiro, o tamanho de cada partição das suas
+    palavras possíveis pelo feedback do palpite `guess`.
+
+    O feedback de cada palavra é calculado uma única vez, mesmo que ela
+    seja possível em vários tabuleiros. A contagem, porém, percorre as
+    palavras de cada tabuleiro: quando os tabuleiros têm palavras
+    diferentes (o caso comum após o primeiro palpite), o custo cresce
+    linearmente com o número de tabuleiros.
+    """
+    patterns: dict[str, int] = {}
+    partitions: list[dict[int, int]] = []
+
+    for words in words_per_board:
+        sizes: dict[int, int] = {}
+        for word in words:
+            pattern = patterns.get(word)
+            if pattern is None:
+                pattern = patterns[word] = get_pattern(guess, word)
+            sizes[pattern] = sizes.get(pattern, 0) + 1
+        partitions.append(sizes)
+
+    return partitions
+
+
+def get_multi_word(words_per_board: list[list[str]], budget: float = TIME_BUDGET,
+                   deadline: float | None = None) -> str:
+    """
+    Retorna o palpite que minimiza a soma, entre os tabuleiros, do número
+    esperado de palavras possíveis após a tentativa (sem contar a palavra
+    acertada, caso o palpite seja a resposta de algum tabuleiro).
+
+    Os palpites são as palavras possíveis em algum tabuleiro, avaliadas na
+    ordem de `get_ranked_words()`; apenas os primeiros cuja avaliação cabe
+    no orçamento de tempo `budget`, descontado o custo da própria ordenação,
+    são considerados (ao menos um). Com prazo `deadline` (em
+    `time.perf_counter()`), retorna o melhor avaliado até o prazo.
+
+    Tabuleiros com exatamente as mesmas palavras possíveis são avaliados
+    uma única vez, com peso igual ao número de tabuleiros.
+    """
+    # Agrupa os tabuleiros com as mesmas palavras possíveis
+    # LEGENDA:   grupos = {palavras: número de tabuleiros}
+    groups: dict[tuple[str, ...], int] = {}
+    for words in words_per_board:
+        key = tuple(words)
+        groups[key] = groups.get(key, 0) + 1
+    distinct_boards: list[tuple[str, ...]] = list(groups)
+    weights: list[int] = list(groups.values())
+
+    # Palavras possíveis em ao menos um tabuleiro, sem repetições
+    union: list[str] = list(dict.fromkeys(word for words in distinct_boards for word in words))
+    candidate_sets: list[set[str]] = [set(words) for words in distinct_boards]
+
+    # Cada palpite calcula o feedback de cada palavra da união uma única vez, e
+    # depois apenas consulta esses feedbacks para as palavras de cada tabuleiro
+    guess_cost: float = (len(union) * PATTERN_COST
+                         + sum(len(words) for words in distinct_boards) * LOOKUP_COST)
+    limit: int = max(1, int((budget - estimate_cost("frequency", len(union))) / guess_cost))
+    guesses: list[str] = get_ranked_words(union, limit)
+
+    def score(guess: str, deadline: float | None) -> float:
+        total = 0.0
+        for words, weight, candidates, sizes in zip(distinct_boards, weights, candidate_sets,
+                                                    get_board_partitions(guess, distinct_boards)):
+            squares = sum(size * size for size in sizes.values())
+            if guess in candidates:
+                squares -= 1
+            total += weight * squares / len(words)
+        return total
+
+    return get_anytime_word(guesses, score, deadline)
+
+
+def multi_player(guess_hist: list[str], res_hists: list[list[list[str]]]) -> str:
+    """
+    Função principal do jogador com vários tabuleiros.
+
+    `res_hists[b]` é o histórico de feedbacks do tabuleiro `b`, com um
+    feedback para cada palpite de `guess_hist`. Tabuleiros já acertados
+    são ignorados.
+    """
+    global boards
+
+    started: float = time.perf_counter()
+
+    if not guess_hist:
+        # Começa uma nova partida; o primeiro palpite só depende do idioma
+        reset(len(res_hists))
+        return first_guess_by_language[player.language]
+
+    # Filtra as palavras de cada tabuleiro ainda não acertado: uma palavra é mantida se o
+    # último palpite produz com ela o mesmo feedback recebido no tabuleiro (equivalente a
+    # `get_filtered_words()`). O feedback de cada palavra é calculado uma única vez, mesmo
+    # que ela seja possível em vários tabuleiros, como no início da partida
+    last_word: str = guess_hist[-1]
+    patterns: dict[str, int] = {}
+    for b, res_hist in enumerate(res_hists):
+        if solved[b]:
+            continue
+        result: int = encode_result(res_hist[-1])
+        if result == PATTERN_WIN:
+            solved[b] = True
+            continue
+
+        filtered: list[str] = []
+        for word in boards[b]:
+            pattern = patterns.get(word)
+            if pattern is None:
+                pattern = patterns[word] = get_pattern(last_word, word)
+            if pattern == result:
+                filtered.append(word)
+        boards[b] = filtered
+
+    pending: list[list[str]] = [boards[b] for b in range(len(boards)) if not solved[b]]
+
+    # Se algum tabuleiro tem apenas uma possibilidade, ela é tentada primeiro
+    for words in pending:
+        if len(words) == 1:
+            return words[0]
+
+    # O tempo gasto filtrando as palavras é descontado do orçamento
+    return get_multi_word(pending, started + TIME_BUDGET - time.perf_counter(), started + TIME_BUDGET)
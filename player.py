@@ -4,15 +4,30 @@
 # Nome completo do segundo membro: Pedro Morais Leal
 # RA do segundo membro: -
 
-from typing import Callable
-from utils import load_words
-
-WORDS: list[str] = load_words()  # Carrega a lista de palavras
-
-# Mantém apenas as palavras de 5 letras
-VALID_WORDS: list[str] = [word for word in WORDS if len(word) == 5]
+import time
+from collections import Counter, OrderedDict
+from heapq import nlargest
+from collections.abc import Callable
+import utils
+from utils import PATTERN_WIN, get_pattern
+from word_index import open_index
+
+# Palavras de 5 letras do idioma atual, carregadas apenas no primeiro uso
+# (ver reset()), a partir do índice de palavras (é uma lista própria de
+# cada processo: apenas o índice em si é compartilhado entre processos)
+VALID_WORDS: list[str] = []
 # Será filtrada com cada tentativa
-possible_words: list[str] = VALID_WORDS.copy()
+possible_words: list[str] = []
+# Idioma das palavras carregadas em VALID_WORDS
+language: str | None = None
+# Cache, por idioma, das palavras de 5 letras e do primeiro palpite (que
+# não depende da partida), mantidos entre partidas do mesmo processo
+words_by_language: dict[str, list[str]] = {}
+first_guess_by_language: dict[str, str] = {}
+# Com prazo, a filtragem pode ser interrompida (ver get_consistent_words()):
+# as palavras ainda não verificadas contra todo o histórico ficam guardadas aqui
+# LEGENDA:   segmentos = [(tentativas do histórico já aplicadas, palavras)]
+unfiltered_words: list[tuple[int, list[str]]] = []
 
 # Globais relacionadas ao algoritmo em get_next_word() que,
 # quando for conveniente, escolhe uma palavra com letras distintas
@@ -23,10 +38,30 @@ letters_to_try: set[str] = set()
 red_count: int | None = None
 last_try_was_distinct: bool = False
 
-
-def get_best_word(words: list[str]) -> str:
+# Globais do despachante de estratégias em get_next_word(), que escolhe
+# a estratégia mais precisa cujo custo estimado cabe no orçamento de tempo:
+# - conjuntos grandes: frequências posicionais (`get_best_word()`);
+# - conjuntos médios: tamanho esperado das partições (`get_partition_word()`);
+# - conjuntos minúsculos: minimax sobre o maior grupo (`get_minimax_word()`).
+TIME_BUDGET: float = 0.05           # Orçamento de tempo por palpite, em segundos
+PATTERN_COST: float = 3e-6          # Custo estimado de uma chamada a get_pattern(), em segundos
+FREQUENCY_COST: float = 3e-6        # Custo estimado de get_best_word() por palavra, em segundos
+DISTINCT_COST: float = 5e-7         # Custo estimado de get_distinct_word() por palavra do dicionário e por letra, em segundos
+MINIMAX_THRESHOLD: int = 20         # Máximo de palavras possíveis para usar o minimax
+MINIMAX_EXTRA_WORDS: int = 300      # Palavras informativas do dicionário consideradas pelo minimax
+DEADLINE_CHECK_INTERVAL: int = 256  # Palavras avaliadas entre consultas ao relógio, com prazo
+
+# Globais da busca de pior caso em get_worst_case_word(), usada nos conjuntos
+# do minimax para garantir o menor número de palpites no pior caso.
+WORST_CASE_DEPTH: int = 6           # Máximo de palpites considerado pela busca
+WORST_CASE_CACHE_SIZE: int = 4096   # Máximo de conjuntos memorizados (LRU)
+# LEGENDA:   cache = {(palavras, palpites): (pior caso, palpite, exato)}
+worst_case_cache: OrderedDict = OrderedDict()
+
+
+def get_frequency_key(words: list[str]) -> Callable:
     """
-    Retorna a melhor palavra da lista a ser escolhida, com base nos
+    Retorna a chave de ordenação usada por `get_best_word()`, com base nos
     seguintes critérios (em ordem decrescente de prioridade):
 
     - Maior quantidade de letras diferentes umas das outras
@@ -37,16 +72,34 @@ def get_best_word(words: list[str]) -> str:
 
     # Para cada posição, guarda um histograma com a frequência de
     # letras naquela posição, com base na lista de palavras fornecida.
-    frequencies: list[dict[str, int]] = [{} for _ in range(5)]
-    for word in words:
-        for i in range(5):
-            frequencies[i][word[i]] = frequencies[i].get(word[i], 0) + 1
+    frequencies: list[Counter] = [Counter(letters) for letters in zip(*words)]
 
-    # Retorna a melhor palavra com base nos critérios citados na docstring
-    return max(words, key=lambda word: (
-                len(set(letter for letter in word)),
-                sum(frequencies[i][word[i]] for i in range(5))
-            ))
+    return lambda word: (
+                len(set(word)),
+                sum(frequencies[i].get(word[i], 0) for i in range(5))
+            )
+
+
+def get_best_word(words: list[str]) -> str:
+    """
+    Retorna a melhor palavra da lista a ser escolhida, com base nos
+    critérios de `get_frequency_key()`.
+    """
+    return max(words, key=get_frequency_key(words))
+
+
+def get_ranked_words(words: list[str], limit: int | None = None) -> list[str]:
+    """
+    Retorna as palavras fornecidas em ordem decrescente pelos critérios de
+    `get_frequency_key()`, de forma que a primeira seja a mesma escolhida
+    por `get_best_word()`. É a ordem em que as estratégias mais caras avaliam
+    os palpites, para que os mais promissores sejam avaliados primeiro.
+
+    Com `limit`, retorna apenas as `limit` primeiras, sem ordenar as demais.
+    """
+    if limit is not None and limit < len(words):
+        return nlargest(limit, words, key=get_frequency_key(words))
+    return sorted(words, key=get_frequency_key(words), reverse=True)
 
 
 def get_distinct_word(last_word: str, red_indexes: list[int]) -> str:
@@ -72,24 +125,304 @@ def get_distinct_word(last_word: str, red_indexes: list[int]) -> str:
             ))
 
 
+def get_partitions(guess: str, words: list[str], deadline: float | None = None) -> dict[int, int] | None:
+    """
+    Agrupa as palavras possíveis `words` pelo feedback que o palpite
+    `guess` produziria caso cada uma delas fosse a resposta, e retorna
+    o tamanho de cada grupo (partição), indexado pelo código do feedback.
+
+    Se o prazo `deadline` (em `time.perf_counter()`) expirar antes do fim
+    da contagem, retorna None.
+    """
+    sizes: dict[int, int] = {}
+
+    if deadline is None:
+        for word in words:
+            pattern = get_pattern(guess, word)
+            sizes[pattern] = sizes.get(pattern, 0) + 1
+        return sizes
+
+    # Com prazo, consulta o relógio a cada bloco de palavras
+    for start in range(0, len(words), DEADLINE_CHECK_INTERVAL):
+        if time.perf_counter() >= deadline:
+            return None
+        for word in words[start:start + DEADLINE_CHECK_INTERVAL]:
+            pattern = get_pattern(guess, word)
+            sizes[pattern] = sizes.get(pattern, 0) + 1
+    return sizes
+
+
+def get_anytime_word(guesses: list[str], score: Callable, deadline: float | None = None) -> str:
+    """
+    Avalia os palpites `guesses` na ordem fornecida e retorna o de menor
+    `score(guess, deadline)`, mantendo o primeiro em caso de empate.
+
+    Se o prazo `deadline` expirar (`score` retorna None), retorna o melhor
+    palpite avaliado até então, ou o primeiro da lista se nenhum foi.
+    """
+    best_word: str = guesses[0]
+    best_score = None
+
+    for guess in guesses:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+        current = score(guess, deadline)
+        if current is None:
+            break
+
+        if best_score is None or current < best_score:
+            best_word, best_score = guess, current
+
+    return best_word
+
+
+def get_partition_word(words: list[str], deadline: float | None = None) -> str:
+    """
+    Retorna, dentre as palavras possíveis, a que minimiza o número esperado
+    de palavras restantes após a tentativa, isto é, a soma dos quadrados dos
+    tamanhos das partições (dividida pelo total, constante entre palpites).
+
+    As palavras são avaliadas na ordem de `get_ranked_words()`, que também
+    desempata. Com prazo `deadline`, retorna a melhor avaliada até então, e
+    apenas as palavras que podem ser avaliadas no tempo restante são ordenadas.
+    """
+    def score(guess: str, deadline: float | None) -> int | None:
+        sizes = get_partitions(guess, words, deadline)
+        if sizes is None:
+            return None
+        return sum(size * size for size in sizes.values())
+
+    limit: int | None = None
+    if deadline is not None:
+        limit = int(max(deadline - time.perf_counter(), 0.0) / (len(words) * PATTERN_COST)) + 1
+
+    return get_anytime_word(get_ranked_words(words, limit), score, deadline)
+
+
+def get_informative_words(words: list[str], limit: int) -> list[str]:
+    """
+    Retorna até `limit` palavras do dicionário que não são possíveis e que
+    contêm mais letras informativas, isto é, letras presentes em algumas
+    (mas não em todas) as palavras possíveis `words`, em ordem decrescente
+    de letras informativas.
+
+    Usa os bitsets de letras do índice compartilhado, sem percorrer as letras
+    de cada palavra do dicionário.
+    """
+    union: int = 0
+    common: int = -1
+    for word in words:
+        mask = 0
+        for letter in word:
+            mask |= 1 << (ord(letter) - ord("A"))
+        union |= mask
+        common &= mask
+    informative: int = union & ~common
+
+    candidates: set[str] = set(words)
+    index = open_index(language)
+    scored = [((mask & informative).bit_count(), i) for i, mask in enumerate(index.masks) if mask & informative]
+    scored.sort(key=lambda item: -item[0])
+
+    extra_words: list[str] = []
+    for _, i in scored:
+        if len(extra_words) >= limit:
+            break
+        if VALID_WORDS[i] not in candidates:
+            extra_words.append(VALID_WORDS[i])
+    return extra_words
+
+
+def get_minimax_word(words: list[str], guesses: list[str], deadline: float | None = None) -> str:
+    """
+    Retorna, dentre as palavras `guesses`, a que minimiza o tamanho da maior
+    partição das palavras possíveis `words` (pior caso), pelos seguintes
+    critérios (em ordem decrescente de prioridade):
+
+    - Menor tamanho da maior partição, sem contar o acerto;
+
+    - Menor número esperado de palavras restantes;
+
+    - Preferência por palavras que ainda podem ser a resposta.
+
+    Com prazo `deadline`, retorna a melhor avaliada até então.
+    """
+    candidates: set[str] = set(words)
+
+    def score(guess: str, deadline: float | None) -> tuple[int, int, bool] | None:
+        sizes = get_partitions(guess, words, deadline)
+        if sizes is None:
+            return None
+        sizes.pop(PATTERN_WIN, None)
+        return (
+            max(sizes.values(), default=0),
+            sum(size * size for size in sizes.values()),
+            guess not in candidates,
+        )
+
+    return get_anytime_word(guesses, score, deadline)
+
+
+def get_worst_case_word(words: tuple[str, ...], probes: tuple[str, ...], limit: int,
+                        deadline: float | None = None) -> tuple[int, str]:
+    """
+    Busca em profundidade (minimax com "branch and bound") o palpite que
+    minimiza o número de palpites necessários, no pior caso, para acertar
+    qualquer uma das palavras possíveis `words`, considerando como palpites,
+    em todos os níveis da busca, as palavras `probes` (que devem incluir as
+    próprias palavras possíveis).
+
+    O resultado é ótimo apenas entre as estratégias que usam palpites de
+    `probes`: um palpite de fora desse conjunto pode, em princípio, ter um
+    pior caso menor.
+
+    Retorna o pior caso e o palpite. Soluções com mais de `limit` palpites
+    não são procuradas: se não houver uma, o pior caso retornado é maior
+    que `limit` (e é apenas um limite inferior).
+
+    Os resultados são memorizados por conjunto de palavras, em um cache LRU
+    com até `WORST_CASE_CACHE_SIZE` conjuntos, mantido entre partidas.
+
+    Se o prazo `deadline` (em `time.perf_counter()`) expirar, a busca é
+    interrompida com `TimeoutError`; os conjuntos já resolvidos continuam
+    memorizados.
+    """
+    n: int = len(words)
+    if n <= 2:
+        # Uma palavra é acertada em 1 palpite; duas, em até 2
+        return n, words[0]
+
+    key = (words, probes)
+    if key in worst_case_cache:
+        worst_case_cache.move_to_end(key)
+        worst, guess, exact = worst_case_cache[key]
+        # Um resultado inexato só serve se o novo limite também não o alcança
+        if exact or worst > limit:
+            return worst, guess
+
+    if deadline is not None and time.perf_counter() >= deadline:
+        raise TimeoutError
+
+    candidates: set[str] = set(words)
+
+    # Agrupa as palavras pelo feedback de cada palpite e ordena os palpites
+    # pelo tamanho da maior partição, avaliando os mais promissores primeiro
+    options: list[tuple[int, bool, str, dict[int, list[str]]]] = []
+    for guess in probes:
+        partitions: dict[int, list[str]] = {}
+        for word in words:
+            partitions.setdefault(get_pattern(guess, word), []).append(word)
+        largest = max((len(part) for pattern, part in partitions.items() if pattern != PATTERN_WIN), default=0)
+        if largest < n:
+            options.append((largest, guess not in candidates, guess, partitions))
+    options.sort(key=lambda option: option[:2])
+
+    best_worst: int = limit + 1
+    best_guess: str = options[0][2] if options else words[0]
+
+    for largest, _, guess, partitions in options:
+        # Com alguma partição de 2 ou mais palavras, são ao menos 3 palpites
+        if 2 + (largest > 1) >= best_worst:
+            break
+
+        worst = 1
+        for pattern, part in sorted(partitions.items(), key=lambda item: -len(item[1])):
+            if pattern == PATTERN_WIN:
+                continue
+            sub_worst, _ = get_worst_case_word(tuple(part), probes, best_worst - 2, deadline)
+            worst = max(worst, 1 + sub_worst)
+            if worst >= best_worst:
+                # Poda: este palpite não melhora o melhor encontrado
+                break
+
+        if worst < best_worst:
+            best_worst, best_guess = worst, guess
+
+    worst_case_cache[key] = (best_worst, best_guess, best_worst <= limit)
+    if len(worst_case_cache) > WORST_CASE_CACHE_SIZE:
+        worst_case_cache.popitem(last=False)
+
+    return best_worst, best_guess
+
+
+def estimate_cost(strategy: str, n: int) -> float:
+    """
+    Estima, em segundos, o custo de escolher um palpite com a estratégia
+    `strategy` quando restam `n` palavras possíveis.
+
+    O custo das palavras distintas ("distinct") não depende de `n`, mas do
+    tamanho do dicionário e da quantidade de letras em `letters_to_try`.
+    """
+    if strategy == "frequency":
+        return n * FREQUENCY_COST
+    elif strategy == "partition":
+        return n * n * PATTERN_COST
+    elif strategy == "minimax":
+        return n * (n + min(MINIMAX_EXTRA_WORDS, len(VALID_WORDS))) * PATTERN_COST
+    elif strategy == "worst_case":
+        return n ** 3 * PATTERN_COST
+    elif strategy == "distinct":
+        return len(VALID_WORDS) * (len(letters_to_try) + 6) * DISTINCT_COST
+    else:
+        raise ValueError
+
+
+def choose_strategy(n: int, budget: float = TIME_BUDGET) -> str:
+    """
+    Escolhe a estratégia de palpite para `n` palavras possíveis, com
+    base no custo estimado de cada uma e no orçamento de tempo `budget`.
+
+    O minimax só é usado em conjuntos minúsculos, e a partição esperada só
+    quando seu custo (quadrático em `n`) cabe no orçamento; caso contrário,
+    usa-se a heurística de frequências, de custo linear.
+    """
+    if n <= MINIMAX_THRESHOLD:
+        return "minimax"
+    if estimate_cost("partition", n) <= budget:
+        return "partition"
+    return "frequency"
+
+
 def get_next_word(words: list[str],
-                  guess_hist: list[str], res_hist: list[list[str]]) -> str:
+                  guess_hist: list[str], res_hist: list[list[str]],
+                  deadline: float | None = None, started: float | None = None) -> str:
     """
-    Decide a próxima palavra a ser tentada, geralmente a
-    melhor em frequências, escolhida por `get_best_word()`.
+    Decide a próxima palavra a ser tentada, com a estratégia escolhida
+    por `choose_strategy()` conforme a quantidade de palavras possíveis:
+    minimax para conjuntos minúsculos, partição esperada para conjuntos
+    médios e, nos demais casos, a melhor em frequências, escolhida por
+    `get_best_word()`.
+
+    O minimax considera também as palavras mais informativas do dicionário
+    quando isso cabe no orçamento de tempo, e apenas as palavras possíveis
+    caso contrário. Seu palpite é então refinado pela busca de pior caso
+    (`get_worst_case_word()`), se ela terminar dentro do orçamento.
+
+    Sem prazo, o orçamento é `TIME_BUDGET` a partir de `started`, o instante
+    em que a escolha do palpite começou (por padrão, agora), de forma que o
+    tempo já gasto, por exemplo filtrando as palavras, também é descontado.
+
+    Com prazo `deadline` (em `time.perf_counter()`), o orçamento passa a ser
+    o tempo restante até o prazo e a escolha se torna "anytime": partindo da
+    melhor em frequências, os palpites são refinados pela partição esperada
+    enquanto houver tempo, e o melhor encontrado até o prazo é retornado.
+    Se nem a heurística de frequências couber no tempo restante, retorna
+    imediatamente a primeira palavra possível.
 
     No caso de a maioria das letras já não estarem mais vermelhas na
     melhor tentativa mas ainda faltar muitas possibilidades para
     preencher as vermelhas restantes, será escolhida uma palavra
     distinta da última e que contenha o máximo de letras que ainda
     são possíveis de se tentar (assim, filtrando o máximo possível
-    de palavras na próxima tentativa).
+    de palavras na próxima tentativa). Como essa busca percorre o dicionário
+    inteiro, ela só é feita se o seu custo estimado couber no orçamento.
     """
-    if not res_hist:
+    if not res_hist and deadline is None:
         return get_best_word(words)
 
-    last_word: str = guess_hist[-1]
-    last_result: list[str] = res_hist[-1]
+    last_word: str = guess_hist[-1] if guess_hist else ""
+    last_result: list[str] = res_hist[-1] if res_hist else []
 
     global letters_to_try
     global closest_result
@@ -101,6 +434,39 @@ def get_next_word(words: list[str],
         # (excluindo tentativas distintas)
         red_count = last_result.count("RED")
 
+    if started is None:
+        started = time.perf_counter()
+    end: float = started + TIME_BUDGET if deadline is None else deadline
+    budget: float = max(end - time.perf_counter(), 0.0)
+    if deadline is not None and estimate_cost("frequency", len(words)) > budget:
+        # Sem tempo nem para a heurística de frequências: qualquer palavra possível serve
+        return words[0]
+
+    strategy: str = choose_strategy(len(words), budget)
+
+    if strategy == "minimax":
+        # Em conjuntos minúsculos, o minimax (se couber no orçamento, também sobre
+        # as palavras mais informativas do dicionário) já cobre o caso das
+        # palavras distintas abaixo
+        guesses = get_ranked_words(words)
+        if estimate_cost("minimax", len(words)) <= budget:
+            guesses += get_informative_words(words, MINIMAX_EXTRA_WORDS)
+        minimax_word: str = get_minimax_word(words, guesses, deadline)
+
+        if estimate_cost("worst_case", len(words)) <= budget:
+            # Refina com a busca de pior caso, que usa como palpites, em todos os
+            # níveis, as palavras possíveis atuais e a palavra do minimax
+            # (interrompida, se necessário, ao fim do orçamento de tempo)
+            probes = tuple(words) if minimax_word in words else (*words, minimax_word)
+            try:
+                worst, worst_case_word = get_worst_case_word(tuple(words), probes, WORST_CASE_DEPTH, end)
+                if worst <= WORST_CASE_DEPTH:
+                    return worst_case_word
+            except TimeoutError:
+                pass
+
+        return minimax_word
+
     if last_result and red_count and red_count <= 2 and (len(possible_words) > DISTINCT_THRESHOLD * red_count):
         if closest_result is None or not last_try_was_distinct:
             # Guarda o resultado da palavra tentada mais próxima da resposta
@@ -119,15 +485,46 @@ def get_next_word(words: list[str],
             for word in possible_words:
                 letters_to_try.add(word[i])
 
-        if len(letters_to_try) > DISTINCT_THRESHOLD * red_count:
-            # Se o threshold é atingido, tenta uma palavra distinta para
-            # maximizar a filtragem de palavras na próxima tentativa
+        if (len(letters_to_try) > DISTINCT_THRESHOLD * red_count
+                and estimate_cost("distinct", len(words)) <= end - time.perf_counter()):
+            # Se o threshold é atingido (e a busca cabe no orçamento), tenta uma palavra
+            # distinta para maximizar a filtragem de palavras na próxima tentativa
             last_try_was_distinct = True
             return get_distinct_word(last_word, red_indexes)
 
+    if strategy == "partition" or deadline is not None:
+        return get_partition_word(words, deadline)
+
     return get_best_word(words)
 
 
+def reset() -> None:
+    """
+    Prepara o jogador para uma nova partida no idioma atual de `utils`,
+    restaurando as globais de estado. As palavras do idioma são carregadas
+    apenas na primeira partida em que ele é usado, junto com o primeiro palpite.
+
+    É chamada por `player()` no primeiro palpite de cada partida.
+    """
+    global VALID_WORDS, possible_words, language, unfiltered_words
+    global closest_result, letters_to_try, red_count, last_try_was_distinct
+
+    language = utils.language
+    if language not in words_by_language:
+        words_by_language[language] = list(open_index(language))
+        # O primeiro palpite só depende do idioma, e é calculado uma única vez
+        first_guess_by_language[language] = get_best_word(words_by_language[language])
+
+    VALID_WORDS = words_by_language[language]
+    possible_words = VALID_WORDS.copy()
+    unfiltered_words = []
+
+    closest_result = None
+    letters_to_try = set()
+    red_count = None
+    last_try_was_distinct = False
+
+
 def get_letter_filter(i: int, tried_letter: str, color: str, non_red: int) -> Callable:
     """
     Retorna um filtro de palavras com base na cor `color` de um índice `i`
@@ -199,14 +596,71 @@ def get_filtered_words(words: list[str], guess_hist: list[str], res_hist: list[l
     return fitered_words
 
 
-def player(guess_hist: list[str], res_hist: list[list[str]]) -> str:
-    """Função principal do jogador."""
+def get_consistent_words(segments: list[tuple[int, list[str]]],
+                         guess_hist: list[str], res_hist: list[list[str]],
+                         deadline: float | None = None) -> tuple[list[str], list[tuple[int, list[str]]]]:
+    """
+    Filtra, com `get_filtered_words()`, as palavras de cada segmento
+    `(aplicadas, palavras)` de `segments` pelas tentativas do histórico a
+    partir da de índice `aplicadas` (as anteriores já foram aplicadas).
+
+    Com prazo `deadline`, as palavras são filtradas em blocos e a filtragem
+    é interrompida quando o prazo expira (depois de ao menos um bloco, para
+    que cada chamada avance), mesmo que nenhuma palavra tenha sido aceita.
+
+    Retorna as palavras filtradas e os segmentos que ficaram por filtrar.
+    """
+    filtered: list[str] = []
+    pending: list[tuple[int, list[str]]] = []
+    blocks: int = 0
+
+    for applied, words in segments:
+        step: int = max(len(words), 1) if deadline is None else DEADLINE_CHECK_INTERVAL
+        for start in range(0, len(words), step):
+            if deadline is not None and blocks and time.perf_counter() >= deadline:
+                pending.append((applied, words[start:]))
+                break
+            blocks += 1
+
+            # As últimas tentativas costumam ser as que mais eliminam palavras
+            block: list[str] = words[start:start + step]
+            for k in reversed(range(applied, len(guess_hist))):
+                block = get_filtered_words(block, guess_hist[:k + 1], res_hist[:k + 1])
+            filtered += block
+
+    return filtered, pending
+
+
+def player(guess_hist: list[str], res_hist: list[list[str]], deadline: float | None = None) -> str:
+    """
+    Função principal do jogador.
+
+    `deadline` é um prazo opcional, em segundos de `time.perf_counter()`,
+    para a escolha do palpite (ver `get_next_word()`).
+    """
+
+    global possible_words, unfiltered_words
+
+    started: float = time.perf_counter()
+
+    if not guess_hist or language != utils.language:
+        # Começa uma nova partida (carregando as palavras no primeiro uso do idioma)
+        reset()
+
+    if not guess_hist:
+        # O primeiro palpite só depende do idioma, e já foi calculado por reset()
+        return first_guess_by_language[language]
 
-    global possible_words
+    # Filtra a lista de palavras pela última tentativa e termina, se houver,
+    # a filtragem interrompida pelo prazo em tentativas anteriores
+    segments = [(len(guess_hist) - 1, possible_words)] + unfiltered_words
+    possible_words, unfiltered_words = get_consistent_words(segments, guess_hist, res_hist, deadline)
 
-    if guess_hist:
-        # Filtra a lista de palavras caso esta não seja a primeira tentativa
-        possible_words = get_filtered_words(possible_words, guess_hist, res_hist)
+    if not possible_words:
+        # O prazo expirou antes de alguma palavra ser aceita: como qualquer palavra do
+        # dicionário é um palpite válido, tenta a primeira ainda não verificada
+        return next((word for _, words in unfiltered_words for word in words if word not in guess_hist),
+                    VALID_WORDS[0])
 
-    next_word: str = get_next_word(possible_words, guess_hist, res_hist)
+    next_word: str = get_next_word(possible_words, guess_hist, res_hist, deadline, started)
     return next_word
\ No newline at end of file
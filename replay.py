@@ -0,0 +1,224 @@
+""" Este módulo contém o registro de partidas e o reprodutor offline de partidas registradas.
+
+O registro é um arquivo de texto em que cada linha é uma partida, sempre acrescentada ao final
+(o arquivo nunca é reescrito). Os campos são separados por tabulação:
+
+    idioma  palavra_secreta  palpites  feedbacks  tempos  prazo
+
+- palpites: palavras separadas por vírgula (ex.: "SERAO,CAMPO");
+- feedbacks: códigos de `utils.get_pattern`, separados por vírgula (ex.: "36,242");
+- tempos: tempo gasto pelo jogador em cada palpite, em microssegundos, separados por vírgula;
+- prazo: prazo por palpite dado ao jogador, em milissegundos (vazio se não houve prazo).
+
+Linhas vazias ou iniciadas por "#" são ignoradas. Linhas sem o campo de prazo (registros
+antigos) são lidas como partidas sem prazo.
+
+O reprodutor lê o registro linha a linha (sem carregá-lo inteiro em memória), roda a versão atual
+do jogador contra as mesmas palavras secretas e informa as partidas em que o número de palpites ou
+o tempo gasto divergem do registrado. Partidas registradas com prazo são reproduzidas com o mesmo
+prazo; como o resultado delas depende da velocidade da máquina, pequenas divergências são esperadas.
+
+As funções principais incluem:
+1. `append_game`: Acrescenta uma partida ao registro.
+2. `read_games`: Percorre as partidas de um registro, uma de cada vez.
+3. `replay_game`: Joga novamente uma partida registrada com o jogador atual.
+4. `replay`: Reproduz um registro inteiro e exibe as divergências e um resumo.
+
+Uso básico:
+    python replay.py partidas.log
+    python replay.py partidas.log --player player_novo --show 50
+"""
+
+# Bibliotecas necessárias
+from collections import namedtuple
+from collections.abc import Iterator
+from importlib import import_module, reload
+import argparse
+import time
+
+from utils import PATTERN_WIN, decode_pattern, encode_result, get_pattern, set_language
+
+LATENCY_TOLERANCE = 1000    # Diferença mínima de tempo total (em microssegundos) para considerar divergência
+
+
+# Uma partida registrada: idioma, palavra secreta, palpites, códigos de feedback, tempos (em microssegundos)
+# e prazo por palpite (em milissegundos, ou None)
+GameRecord = namedtuple("GameRecord", ["lang", "secret", "guesses", "patterns", "timings", "deadline"],
+                        defaults=[None])
+
+
+def format_game(lang: str, secret: str, guesses: list[str], results: list[list[str]], timings: list[float],
+                deadline: float | None = None) -> str:
+    """ Formata uma partida como uma linha do registro.
+
+    Parâmetros:
+        - lang: Idioma da partida.
+        - secret: Palavra secreta.
+        - guesses: Palpites, na ordem em que foram feitos.
+        - results: Feedbacks (listas de cores) de cada palpite.
+        - timings: Tempo gasto pelo jogador em cada palpite, em segundos.
+        - deadline: Prazo por palpite dado ao jogador, em milissegundos (None se não houve prazo).
+    """
+    return "\t".join([
+        lang,
+        secret,
+        ",".join(guesses),
+        ",".join(str(encode_result(result)) for result in results),
+        ",".join(str(round(timing * 1_000_000)) for timing in timings),
+        "" if deadline is None else repr(float(deadline)),
+    ]) + "\n"
+
+
+def append_game(path: str, lang: str, secret: str, guesses: list[str],
+                results: list[list[str]], timings: list[float], deadline: float | None = None):
+    """ Acrescenta uma partida ao final do registro `path` (ver `format_game`).
+
+    A linha é escrita com uma única chamada, para que processos diferentes possam
+    acrescentar partidas ao mesmo arquivo sem misturar os registros.
+    """
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(format_game(lang, secret, guesses, results, timings, deadline))
+
+
+def parse_game(line: str) -> GameRecord:
+    """ Converte uma linha do registro em uma partida. """
+    fields = line.rstrip("\n").split("\t")
+    lang, secret, guesses, patterns, timings = fields[:5]
+    deadline = fields[5] if len(fields) > 5 else ""
+    return GameRecord(
+        lang,
+        secret,
+        guesses.split(",") if guesses else [],
+        [int(pattern) for pattern in patterns.split(",")] if patterns else [],
+        [int(timing) for timing in timings.split(",")] if timings else [],
+        float(deadline) if deadline else None,
+    )
+
+
+def read_games(path: str) -> Iterator[GameRecord]:
+    """ Percorre as partidas do registro `path`, lendo uma linha de cada vez. """
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            if not line.strip() or line.startswith("#"):
+                continue
+            yield parse_game(line)
+
+
+def replay_game(solver, record: GameRecord, max_attempts: int = 1000) -> tuple[list[str], list[int]]:
+    """ Joga novamente a partida `record` com o módulo do jogador `solver`.
+
+    O estado do jogador é restaurado antes da partida com `solver.reset()` ou, se o módulo
+    não a define, recarregando o módulo, para que o estado global de uma partida não afete a próxima.
+    Se a partida foi registrada com prazo, cada palpite recebe o mesmo prazo, contado a partir da
+    chamada ao jogador.
+
+    Retorno
+        tuple: Palpites feitos e tempo de cada palpite, em microssegundos.
+    """
+    set_language(record.lang)
+    if hasattr(solver, "reset"):
+        solver.reset()
+    else:
+        reload(solver)
+
+    guess_hist = []
+    res_hist = []
+    timings = []
+
+    while len(guess_hist) < max_attempts:
+        start = time.perf_counter()
+        if record.deadline is None:
+            guess = solver.player(guess_hist, res_hist)
+        else:
+            guess = solver.player(guess_hist, res_hist, start + record.deadline / 1000)
+        timings.append(round((time.perf_counter() - start) * 1_000_000))
+
+        pattern = get_pattern(guess, record.secret)
+        guess_hist.append(guess)
+        res_hist.append(decode_pattern(pattern))
+
+        if pattern == PATTERN_WIN:
+            break
+
+    return guess_hist, timings
+
+
+def replay(path: str, solver_name: str = "player", limit: int | None = None,
+           show: int = 20, latency_factor: float = 2.0) -> dict[str, int]:
+    """ Reproduz as partidas do registro `path` com o jogador `solver_name` e compara os resultados.
+
+    Uma partida diverge em palpites se o número de palpites mudou, e em tempo se o tempo total
+    gasto pelo jogador ficou mais de `latency_factor` vezes maior que o registrado (e mais de
+    `LATENCY_TOLERANCE` microssegundos acima). As primeiras `show` divergências são exibidas.
+
+    Retorno
+        dict: Contagens do resumo (partidas, melhores, piores, mais lentas e totais de palpites).
+    """
+    solver = import_module(solver_name)
+    summary = {"games": 0, "better": 0, "worse": 0, "slower": 0, "old_guesses": 0, "new_guesses": 0}
+    shown = 0
+
+    for record in read_games(path):
+        if limit is not None and summary["games"] >= limit:
+            break
+
+        guesses, timings = replay_game(solver, record)
+        old_time, new_time = sum(record.timings), sum(timings)
+
+        summary["games"] += 1
+        summary["old_guesses"] += len(record.guesses)
+        summary["new_guesses"] += len(guesses)
+
+        diverged = False
+        if len(guesses) < len(record.guesses):
+            summary["better"] += 1
+            diverged = True
+        elif len(guesses) > len(record.guesses):
+            summary["worse"] += 1
+            diverged = True
+        if new_time > latency_factor * old_time and new_time - old_time > LATENCY_TOLERANCE:
+            summary["slower"] += 1
+            diverged = True
+
+        if diverged and shown < show:
+            shown += 1
+            print(f"[{record.lang}] {record.secret}: "
+                  f"{len(record.guesses)} -> {len(guesses)} palpites, "
+                  f"{old_time / 1000:.1f} -> {new_time / 1000:.1f} ms "
+                  f"({','.join(record.guesses)} -> {','.join(guesses)})")
+
+    return summary
+
+
+def parse_arguments():
+    """Configura o argparse para receber o registro e as opções do reprodutor."""
+    parser = argparse.ArgumentParser(
+        description="Reproduz partidas registradas com a versão atual do jogador e exibe as divergências."
+    )
+    parser.add_argument("log", type=str, help="Arquivo de registro de partidas.")
+    parser.add_argument("--player", type=str, default="player", help="Módulo do jogador a ser testado. Padrão: 'player'.")
+    parser.add_argument("--limit", type=int, default=None, help="Número máximo de partidas reproduzidas.")
+    parser.add_argument("--show", type=int, default=20, help="Número máximo de divergências exibidas. Padrão: 20.")
+    parser.add_argument("--latency-factor", type=float, default=2.0,
+                        help="Fator de aumento do tempo total de uma partida para considerá-la mais lenta. Padrão: 2.0.")
+    return parser.parse_args()
+
+
+def main():
+    """ Função principal do reprodutor. """
+    args = parse_arguments()
+    summary = replay(args.log, args.player, args.limit, args.show, args.latency_factor)
+
+    games = summary["games"]
+    print(f"\nReprodução finalizada!\n")
+    print(f"Partidas reproduzidas: {games}")
+    if games:
+        print(f"Média de tentativas registrada: {summary['old_guesses'] / games}")
+        print(f"Média de tentativas atual: {summary['new_guesses'] / games}")
+    print(f"Partidas com menos tentativas: {summary['better']}")
+    print(f"Partidas com mais tentativas: {summary['worse']}")
+    print(f"Partidas mais lentas: {summary['slower']}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,28 +13,28 @@ com o objetivo de minimizar o número de tentativas até a palavra correta ser a
 """
 
 # Bibliotecas e módulos necessários
-from utils import choose_secret_word, load_words, set_language       
-from importlib import reload
+from utils import PATTERN_WIN, choose_adversarial_result, choose_secret_word, decode_pattern, set_language
+from replay import append_game
+from word_index import open_index
+import argparse
+import multiboard
 import player
 import random
-
-# Verificar se o Tqdm está instalado, caso contrário, exibir mensagem de erro e encerrar o programa.
-try:
-    from tqdm import tqdm
-except ImportError:
-    print(
-        "Tqdm não foi instalado. Por favor, cheque o README para mais informações ou consulte um monitor."
-    )
-    exit(1)
+import time
 
 MAX_LETTERS = 5                                                                             # Máximo de letras da palavra secreta
-WORDS = dict()
+LANGUAGES = ["pt", "en", "fr", "it", "sp"]                                                  # Idiomas disponíveis
+WORDS = dict()                                                                              # Palavras com 5 letras de cada idioma já carregado
 
-WORDS["pt"] = [word for word in load_words(lang="pt") if len(word) == MAX_LETTERS]         # Lista de palavras com 5 letras em português
-WORDS["en"] = [word for word in load_words(lang="en") if len(word) == MAX_LETTERS]         # Lista de palavras com 5 letras em inglês
-WORDS["fr"] = [word for word in load_words(lang="fr") if len(word) == MAX_LETTERS]         # Lista de palavras com 5 letras em francês
-WORDS["it"] = [word for word in load_words(lang="it") if len(word) == MAX_LETTERS]         # Lista de palavras com 5 letras em italiano
-WORDS["sp"] = [word for word in load_words(lang="sp") if len(word) == MAX_LETTERS]         # Lista de palavras com 5 letras em espanhol
+def get_words(lang):
+    """ Retorna as palavras de 5 letras do idioma 'lang', carregando-as apenas no primeiro uso.
+    
+    São usados os índices compartilhados (mapeados em memória) de `word_index`, para que vários
+    processos executando o torneio usem uma única cópia das listas de palavras.
+    """
+    if lang not in WORDS:
+        WORDS[lang] = open_index(lang)
+    return WORDS[lang]
 
 def feedback(guess, code, words):
     """ Compara o palpite do jogador com a palavra secreta e retorna um feedback de cores.
@@ -84,58 +84,306 @@ def feedback(guess, code, words):
             
     return colors_feedback
           
-def main():
-    """ Função principal do torneio.
+def multi_feedback(guess, codes, words):
+    """ Compara o palpite do jogador com várias palavras secretas (uma por tabuleiro).
     
-        Simula vários jogos para calcular a média de tentativas necessárias para acertar a palavra secreta.
+    Parâmetros:
+        - guess: Palpite do jogador.
+        - codes: Palavras secretas de cada tabuleiro.
+        - words: Palavras válidas.
+    
+    Retorna:
+        - Lista com o feedback (lista de cores) de cada tabuleiro, ou None se o palpite for inválido.
     """
-    global WORDS
-    max_games = 500                                     # Número total de jogos a serem simulados
-    max_attempts = 1000                                 # Número máximo de tentativas por jogo
-    sum_guesses = 0                                     # Soma total de tentativas
+    results = [feedback(guess, code, words) for code in codes]
+    if results and results[0] is None:
+        return None
+    return results
+
+def parse_arguments():
+    """Configura o argparse para receber os parâmetros do torneio."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Torneio de adivinhação de palavras. Simula várias partidas do jogador automático.\n\n"
+            "Uso básico:\n"
+            "  python tournament.py                          (500 partidas, sem prazo por palpite)\n"
+            "  python tournament.py --deadline 1 5 20 100    (média de tentativas para cada prazo, em ms)\n"
+        ),
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+
+    # Argumento para o número de partidas simuladas
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=500,
+        help="Número de partidas simuladas (para cada prazo, se houver). \nPadrão: 500."
+    )
+
+    # Argumento para os prazos por palpite
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        nargs="+",
+        help="Prazos por palpite, em milissegundos. Para cada prazo, roda um torneio com as mesmas \npalavras secretas e exibe uma tabela de média de tentativas por prazo."
+    )
+
+    # Argumento para a semente aleatória
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Semente aleatória para a escolha dos idiomas e palavras secretas."
+    )
+
+    # Argumento para o registro de partidas
+    parser.add_argument(
+        "--log",
+        type=str,
+        default=None,
+        help="Arquivo em que cada partida é acrescentada (ver replay.py), para reprodução posterior."
+    )
+
+    # Argumento booleano para o modo adversário
+    parser.add_argument(
+        "--adversarial",
+        action="store_true",
+        help="Modo adversário (estilo Absurdle): a palavra secreta é escolhida para prolongar ao máximo cada \npartida. Joga uma partida por idioma e exibe o pior caso de tentativas e o tempo por palpite."
+    )
+
+    # Argumento para o número de tabuleiros simultâneos
+    parser.add_argument(
+        "--boards",
+        type=int,
+        default=1,
+        help="Número de tabuleiros simultâneos (4 para Quordle, 8 para Octordle), jogados por multiboard.py. \nPadrão: 1."
+    )
+
+    return parser.parse_args()
+
+def import_tqdm():
+    """ Importa e retorna o `tqdm`, usado para exibir a barra de progresso dos torneios.
+    
+    A importação é feita apenas pelos modos que o usam, para não atrasar a inicialização.
+    """
+    # Verificar se o Tqdm está instalado, caso contrário, exibir mensagem de erro e encerrar o programa.
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        print(
+            "Tqdm não foi instalado. Por favor, cheque o README para mais informações ou consulte um monitor."
+        )
+        exit(1)
+    return tqdm
+
+def run_tournament(max_games, max_attempts, deadline=None, log=None):
+    """ Simula 'max_games' jogos com o jogador automático.
+    
+        Parâmetros:
+            - max_games: Número total de jogos a serem simulados.
+            - max_attempts: Número máximo de tentativas por jogo.
+            - deadline: Prazo por palpite, em milissegundos (None para nenhum prazo).
+            - log: Arquivo de registro em que cada partida é acrescentada (None para não registrar).
+        
+        Retorna:
+            - Lista com o número de tentativas de cada jogo ('max_attempts' para as falhas), o total de falhas,
+              a lista com o tempo gasto em cada palpite, em segundos, e a lista com o tempo dos primeiros
+              palpites de cada idioma no processo (que incluem o carregamento das palavras e o cálculo do
+              primeiro palpite, e não entram na lista anterior).
+    """
+    tqdm = import_tqdm()
     
     # Listas e contadores para estatísticas
     attempts_list = []
+    time_list = []
+    warmup_list = []
     fails = 0
     
     # Repete o jogo 'max_games' vezes e usa o tqdm para exibir uma barra de progresso
     for _ in tqdm(range(max_games)):
-        lang = random.choice(["pt", "en", "fr", "it", "sp"])    # Escolhe um idioma aleatório
-        set_language(lang)                                      # Define o idioma para português
-        CODE = choose_secret_word(WORDS[lang])                  # Escolhe uma palavra secreta aleatória pertencente a um idioma aleatório
-        reload(player)                                          # Recarrega o módulo player para evitar problemas de cache (variável global)
+        lang = random.choice(LANGUAGES)                         # Escolhe um idioma aleatório
+        set_language(lang)                                      # Define o idioma da partida
+        CODE = choose_secret_word(get_words(lang))              # Escolhe uma palavra secreta aleatória pertencente a um idioma aleatório
+        cold = lang not in player.words_by_language             # Primeira partida do idioma: o player carrega as palavras no 1º palpite
         guess_hist = []                                         # Histórico de palpites
         res_hist = []                                           # Histórico de feedbacks
+        time_hist = []                                          # Histórico de tempo gasto pelo player em cada palpite
         attempts = 0                                            # Número de tentativas
         win = False                                             # Flag para indicar se o jogador acertou a palavra 
 
         # Simular o jogo até o player acertar a palavra ou atingir o número máximo de tentativas
         while attempts < max_attempts:
             res = None
+            elapsed = 0
             
             # Garante que o palpite seja válido
             while res is None:   
-                guess = player.player(guess_hist, res_hist)
-                res = feedback(guess, CODE, WORDS[lang])
+                # O prazo do palpite é contado a partir do momento em que o player é chamado
+                start = time.perf_counter()
+                limit = None if deadline is None else start + deadline / 1000
+                guess = player.player(guess_hist, res_hist, limit)
+                elapsed += time.perf_counter() - start
+                res = feedback(guess, CODE, get_words(lang))
                 
             guess_hist.append(guess)                    # Adiciona o palpite ao histórico
             res_hist.append(res)                        # Adiciona o feedback ao histórico
+            time_hist.append(elapsed)                   # Adiciona o tempo do palpite ao histórico
             attempts += 1                               # Incrementa o número de tentativas
 
             # Se todas as letras estiverem corretas, encerra o jogo e armazena o número de tentativas
             if res == ["GREEN"] * 5:
-                sum_guesses += attempts
                 attempts_list.append(attempts)  
                 win = True
                 break
             
         if not win:
-            sum_guesses += max_attempts
             attempts_list.append(max_attempts)
             fails += 1
+        
+        # O 1º palpite restaura o estado do player (ver `player.reset`) e, na primeira partida do idioma,
+        # inclui o aquecimento, que é contabilizado à parte
+        if cold:
+            warmup_list.append(time_hist[0])
+            time_list += time_hist[1:]
+        else:
+            time_list += time_hist
+        
+        # Registra a partida, se solicitado
+        if log is not None:
+            append_game(log, lang, CODE, guess_hist, res_hist, time_hist, deadline)
+    
+    return attempts_list, fails, time_list, warmup_list
+
+def run_multiboard_tournament(max_games, max_attempts, n_boards):
+    """ Simula 'max_games' jogos com 'n_boards' tabuleiros simultâneos, jogados por `multiboard.multi_player`.
+    
+        Cada palpite é comparado com as palavras secretas de todos os tabuleiros, e o jogo termina quando
+        todas forem acertadas.
+        
+        Parâmetros:
+            - max_games: Número total de jogos a serem simulados.
+            - max_attempts: Número máximo de tentativas por jogo.
+            - n_boards: Número de tabuleiros (palavras secretas) por jogo.
+        
+        Retorna:
+            - Lista com o número de tentativas de cada jogo ('max_attempts' para as falhas), o total de falhas,
+              a lista com o tempo gasto em cada palpite, em segundos, e a lista com o tempo dos primeiros
+              palpites de cada idioma no processo (que incluem o carregamento das palavras e o cálculo do
+              primeiro palpite, e não entram na lista anterior).
+    """
+    tqdm = import_tqdm()
+    
+    # Listas e contadores para estatísticas
+    attempts_list = []
+    time_list = []
+    warmup_list = []
+    fails = 0
+    
+    for _ in tqdm(range(max_games)):
+        lang = random.choice(LANGUAGES)                         # Escolhe um idioma aleatório
+        set_language(lang)                                      # Define o idioma da partida
+        words = get_words(lang)
+        
+        # Escolhe palavras secretas distintas para cada tabuleiro
+        codes = []
+        while len(codes) < n_boards:
+            code = choose_secret_word(words)
+            if code not in codes:
+                codes.append(code)
+        
+        cold = lang not in multiboard.first_guess_by_language   # Primeira partida do idioma: o 1º palpite é calculado na hora
+        guess_hist = []                                         # Histórico de palpites
+        res_hists = [[] for _ in range(n_boards)]               # Histórico de feedbacks de cada tabuleiro
+        pending = set(range(n_boards))                          # Tabuleiros ainda não acertados
+        attempts = 0
+
+        while attempts < max_attempts and pending:
+            res = None
+            
+            # Garante que o palpite seja válido
+            while res is None:
+                # O 1º palpite restaura o estado do jogador (ver `multiboard.reset`) e, na primeira partida
+                # do idioma, inclui o aquecimento, que é contabilizado à parte
+                start = time.perf_counter()
+                guess = multiboard.multi_player(guess_hist, res_hists)
+                if cold and attempts == 0:
+                    warmup_list.append(time.perf_counter() - start)
+                else:
+                    time_list.append(time.perf_counter() - start)
+                res = multi_feedback(guess, codes, words)
+            
+            guess_hist.append(guess)
+            for board in range(n_boards):
+                res_hists[board].append(res[board])
+                if res[board] == ["GREEN"] * 5:
+                    pending.discard(board)
+            attempts += 1
+        
+        if pending:
+            attempts_list.append(max_attempts)
+            fails += 1
+        else:
+            attempts_list.append(attempts)
+    
+    return attempts_list, fails, time_list, warmup_list
+
+def run_adversarial_tournament(max_attempts, languages=LANGUAGES, log=None):
+    """ Joga uma partida no modo adversário (estilo Absurdle) para cada idioma.
+    
+        Após cada palpite, o jogo mantém o maior grupo de palavras secretas possíveis com o mesmo feedback
+        (ver `utils.choose_adversarial_result`), forçando os caminhos mais longos e lentos do jogador.
+        Como o jogador e o adversário são determinísticos, uma partida por idioma basta.
+        
+        Parâmetros:
+            - max_attempts: Número máximo de tentativas por jogo.
+            - languages: Idiomas jogados.
+            - log: Arquivo de registro em que cada partida é acrescentada (None para não registrar).
+        
+        Retorna:
+            - Dicionário com, para cada idioma, o número de tentativas ('max_attempts' em caso de falha)
+              e a lista com o tempo gasto em cada palpite, em segundos.
+    """
+    results = dict()
+    
+    for lang in languages:
+        set_language(lang)                                      # Define o idioma da partida
+        words = get_words(lang)
+        candidates = list(words)                                # Palavras secretas ainda possíveis
+        guess_hist = []                                         # Histórico de palpites
+        res_hist = []                                           # Histórico de feedbacks
+        time_hist = []                                          # Histórico de tempo gasto pelo player em cada palpite
+        
+        while len(guess_hist) < max_attempts:
+            guess = None
+            
+            # Garante que o palpite seja válido
+            while guess not in words:
+                start = time.perf_counter()
+                guess = player.player(guess_hist, res_hist)
+                elapsed = time.perf_counter() - start
+            
+            pattern, candidates = choose_adversarial_result(guess, candidates)
+            guess_hist.append(guess)
+            res_hist.append(decode_pattern(pattern))
+            time_hist.append(elapsed)
+            
+            if pattern == PATTERN_WIN:
+                break
+        
+        # Registra a partida, com a última palavra possível como palavra secreta
+        if log is not None:
+            append_game(log, lang, candidates[0], guess_hist, res_hist, time_hist)
+        
+        solved = res_hist[-1] == ["GREEN"] * 5
+        results[lang] = (len(guess_hist) if solved else max_attempts, time_hist)
+    
+    return results
+
+def print_results(max_games, max_attempts, attempts_list, fails):
+    """ Exibe as estatísticas de um torneio: média, mediana, desvio padrão, mínimo e máximo de tentativas. """
     
     # cálculo da mediana, desvio padrão, mínimo, máximo
-    media = sum_guesses / max_games if max_games else 0
+    media = sum(attempts_list) / max_games if max_games else 0
     mediana = sorted(attempts_list)[len(attempts_list) // 2] if attempts_list else 0
     desvio_padrao = (sum((x - media) ** 2 for x in attempts_list) / len(attempts_list)) ** 0.5 if attempts_list else 0
     minimo = min(attempts_list) 
@@ -152,5 +400,64 @@ def main():
     print(f"Máximo de tentativas: {maximo}")
     print(f"Total de falhas: {fails}\n")
 
+def main():
+    """ Função principal do torneio.
+    
+        Simula vários jogos para calcular a média de tentativas necessárias para acertar a palavra secreta.
+        Se prazos por palpite forem informados, repete o torneio para cada prazo (com as mesmas palavras
+        secretas) e exibe a média de tentativas em função do prazo.
+    """
+    args = parse_arguments()
+    max_games = args.games                              # Número total de jogos a serem simulados
+    max_attempts = 1000                                 # Número máximo de tentativas por jogo
+    
+    if args.adversarial:
+        results = run_adversarial_tournament(max_attempts, log=args.log)
+        all_times = [elapsed for _, time_hist in results.values() for elapsed in time_hist]
+        
+        # Mostrar os resultados do modo adversário
+        print(f"\nTorneio adversário finalizado!\n")
+        print(f"{'Idioma':>8} {'Tentativas':>11} {'Tempo médio (ms)':>17} {'Tempo máximo (ms)':>18}")
+        for lang, (attempts, time_hist) in results.items():
+            print(f"{lang:>8} {attempts:>11} {1000 * sum(time_hist) / len(time_hist):>17.2f} {1000 * max(time_hist):>18.2f}")
+        print(f"\nPior caso de tentativas: {max(attempts for attempts, _ in results.values())}")
+        print(f"Tempo médio por palpite: {1000 * sum(all_times) / len(all_times):.2f} ms")
+        print(f"Tempo máximo por palpite: {1000 * max(all_times):.2f} ms\n")
+        return
+    
+    if args.boards > 1:
+        random.seed(args.seed)
+        attempts_list, fails, time_list, warmup_list = run_multiboard_tournament(max_games, max_attempts, args.boards)
+        print_results(max_games, max_attempts, attempts_list, fails)
+        print(f"Tabuleiros por jogo: {args.boards}")
+        print(f"Tempo médio por palpite: {1000 * sum(time_list) / len(time_list):.2f} ms")
+        print(f"Tempo máximo por palpite: {1000 * max(time_list):.2f} ms (sem o aquecimento)")
+        print(f"Tempo máximo do aquecimento (1º palpite de cada idioma): {1000 * max(warmup_list):.2f} ms\n")
+        return
+    
+    if not args.deadline:
+        random.seed(args.seed)
+        attempts_list, fails, _, _ = run_tournament(max_games, max_attempts, log=args.log)
+        print_results(max_games, max_attempts, attempts_list, fails)
+        return
+    
+    # Mesma semente para todos os prazos, para que as partidas sejam comparáveis
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    rows = []
+    for deadline in args.deadline:
+        random.seed(seed)
+        attempts_list, fails, time_list, warmup_list = run_tournament(max_games, max_attempts, deadline, args.log)
+        warmup = f"{1000 * max(warmup_list):.2f}" if warmup_list else "-"
+        rows.append((deadline, sum(attempts_list) / max_games, max(attempts_list), fails, 1000 * max(time_list), warmup))
+    
+    # Mostrar a tabela de média de tentativas por prazo, com o maior tempo medido de um palpite
+    # (que deve ficar próximo do prazo) e, à parte, o do 1º palpite de cada idioma no processo,
+    # que carrega as palavras e calcula o primeiro palpite sem respeitar o prazo
+    print(f"\nTorneio finalizado! ({max_games} partidas por prazo, semente {seed})\n")
+    print(f"{'Prazo (ms)':>12} {'Média':>8} {'Máximo':>8} {'Falhas':>8} {'Tempo máximo (ms)':>18} {'Aquecimento (ms)':>17}")
+    for deadline, media, maximo, fails, max_time, warmup in rows:
+        print(f"{deadline:>12g} {media:>8.3f} {maximo:>8} {fails:>8} {max_time:>18.2f} {warmup:>17}")
+    print()
+
 if __name__ == "__main__":
-    main()  
\ No newline at end of file
+    main()
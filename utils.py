@@ -6,6 +6,10 @@ As funções principais incluem:
                  processando e retornando as palavras em maiúsculas.
 3. `choose_secret_word`: Escolhe aleatoriamente uma palavra secreta de 5 letras a partir da lista de palavras carregadas,
                          podendo ser personalizada com uma lista fornecida pelo usuário.
+4. `get_pattern`: Calcula o feedback de um palpite em relação a uma palavra secreta, codificado como um inteiro.
+5. `encode_result` e `decode_pattern`: Convertem entre a lista de cores de um feedback e o seu código inteiro.
+6. `choose_adversarial_result`: Escolhe o feedback de um palpite no modo adversário (estilo Absurdle), em que a
+                                palavra secreta só é definida quando não há mais como evitá-la.
 
 Além disso, o arquivo define um dicionário de cores (`ALL_COLORS`) utilizado para a interface do jogo e para
 representar os diferentes estados do palpite (como "correto", "presente mas na posição errada", "ausente").
@@ -18,6 +22,9 @@ import random
 
 dicts = dict()   # Dicionário para armazenar as palavras carregadas de cada idioma
 language = "pt"  # Idioma padrão para o jogo
+PATTERN_WIN = 242  # Código de feedback com as 5 letras verdes (ver `get_pattern`)
+PATTERN_COLORS = ["RED", "YELLOW", "GREEN"]                             # Cor de cada dígito do código de feedback
+PATTERN_DIGITS = {color: i for i, color in enumerate(PATTERN_COLORS)}   # Dígito de cada cor do código de feedback
 
 # Dicionário de cores usado para definir as cores do jogo, tanto para exibição quanto para feedback ao jogador
 ALL_COLORS = {
@@ -79,4 +86,79 @@ def choose_secret_word(words = None):
     # Escolher uma palavra aleatória da lista filtrada
     code = random.choice(possible_words)
     
-    return code
\ No newline at end of file
+    return code
+
+def get_pattern(guess, code):
+    """ Calcula o feedback do palpite `guess` para a palavra secreta `code`, codificado como um inteiro.
+
+    Cada posição `i` contribui com `cor * 3**i`, sendo 0 para "RED", 1 para "YELLOW" e 2 para "GREEN",
+    seguindo as mesmas regras de `tournament.feedback` (inclusive para letras repetidas). Assim, dois
+    palpites produzem o mesmo código se e somente se produzem as mesmas cores, o que permite agrupar
+    palavras por feedback sem montar listas de cores.
+
+    Retorno
+        int: Código do feedback, entre 0 e `PATTERN_WIN`.
+    """
+    # Letras da palavra secreta que não foram acertadas na posição exata
+    remaining = {}
+    for g, c in zip(guess, code):
+        if g != c:
+            remaining[c] = remaining.get(c, 0) + 1
+
+    pattern = 0
+    weight = 1
+    for g, c in zip(guess, code):
+        if g == c:
+            pattern += 2 * weight
+        elif remaining.get(g, 0):
+            pattern += weight
+            remaining[g] -= 1
+        weight *= 3
+
+    return pattern
+
+def encode_result(colors):
+    """ Converte uma lista de cores de feedback ("GREEN", "YELLOW", "RED") no código de `get_pattern`.
+    
+    Retorno
+        int: Código do feedback.
+    """
+    pattern = 0
+    for i, color in enumerate(colors):
+        pattern += PATTERN_DIGITS[color] * 3 ** i
+    return pattern
+
+def decode_pattern(pattern):
+    """ Converte um código de `get_pattern` de volta na lista de cores de feedback.
+    
+    Retorno
+        list: Lista com 5 cores ("GREEN", "YELLOW" ou "RED").
+    """
+    colors = []
+    for _ in range(5):
+        pattern, digit = divmod(pattern, 3)
+        colors.append(PATTERN_COLORS[digit])
+    return colors
+
+def choose_adversarial_result(guess, candidates):
+    """ Escolhe o feedback do palpite no modo adversário (estilo Absurdle).
+    
+    Em vez de se comprometer com uma palavra secreta, o jogo agrupa as palavras secretas ainda possíveis
+    pelo feedback que o palpite produziria e mantém o maior grupo, prolongando o jogo ao máximo. Em caso de
+    empate, evita o acerto e, depois, prefere o menor código de feedback. O jogador só acerta quando a única
+    palavra restante é o seu palpite.
+    
+    Parâmetros:
+        - guess: Palpite do jogador.
+        - candidates: Palavras secretas ainda possíveis.
+    
+    Retorno
+        tuple: Código do feedback escolhido (ver `get_pattern`) e lista das palavras secretas que continuam possíveis.
+    """
+    # Agrupa as palavras possíveis pelo feedback, calculando cada um uma única vez
+    partitions = {}
+    for word in candidates:
+        partitions.setdefault(get_pattern(guess, word), []).append(word)
+    
+    pattern = max(partitions, key=lambda p: (len(partitions[p]), p != PATTERN_WIN, -p))
+    return pattern, partitions[pattern]
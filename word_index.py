@@ -0,0 +1,177 @@
+""" Este módulo contém um índice de palavras somente leitura, mapeado em memória.
+
+As palavras de 5 letras de um idioma são gravadas em um arquivo binário, que é aberto com `mmap`:
+todos os processos enxergam as mesmas páginas do cache do sistema operacional, sem cópias. O que é
+compartilhado é apenas o que é lido diretamente do índice: as verificações de palavra válida do
+torneio (`in`, por busca binária) e os bitsets de letras usados por `player.get_informative_words`.
+
+O jogador, por sua vez, trabalha sobre uma lista própria de `str` (ver `player.reset`), criada a
+partir do índice uma vez por idioma em cada processo: essa lista não é compartilhada, e cada worker
+de um pool mantém a sua cópia.
+
+Formato do arquivo 'words_lang.idx' (inteiros sem sinal de 32 bits, ordem de bytes nativa):
+1. Cabeçalho: `MAGIC` (8 bytes) seguido da quantidade `n` de palavras.
+2. Matriz de letras: `n * 5` bytes ASCII, a palavra `i` ocupa os bytes `[5*i, 5*i + 5)`.
+3. Bitsets: `n` inteiros, o bit `k` indica que a letra `chr(ord('A') + k)` aparece na palavra.
+4. Ordenação: `n` índices que colocam as palavras em ordem alfabética (busca binária).
+
+As palavras são mantidas na mesma ordem do arquivo 'words_lang.txt', para que quem percorra o
+índice obtenha exatamente a mesma sequência que `load_words()` devolveria.
+
+As funções principais incluem:
+1. `build_index`: Gera o arquivo de índice de um idioma a partir de 'words_lang.txt'.
+2. `open_index`: Abre (gerando se necessário) o índice de um idioma, uma única vez por processo.
+"""
+
+# Bibliotecas necessárias
+from array import array
+from bisect import bisect_left
+import mmap
+import os
+
+import utils
+
+MAGIC = b"WRDIDX01"         # Identificador do formato do arquivo
+WORD_SIZE = 5               # Tamanho das palavras indexadas
+HEADER_SIZE = len(MAGIC) + 4
+
+_indexes: dict[str, "WordIndex"] = {}   # Índices já abertos neste processo
+
+
+class _SortedView:
+    """ Sequência das palavras do índice em ordem alfabética, usada pela busca binária. """
+
+    def __init__(self, index: "WordIndex"):
+        self._index = index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __getitem__(self, i: int) -> str:
+        return self._index[self._index.order[i]]
+
+
+class WordIndex:
+    """ Índice de palavras de 5 letras de um idioma, mapeado em memória e somente leitura.
+
+    Atributos:
+        - lang: Idioma do índice.
+        - letters: `memoryview` com a matriz de letras (5 bytes por palavra).
+        - masks: `memoryview` com o bitset de letras de cada palavra.
+        - order: `memoryview` com os índices das palavras em ordem alfabética.
+    """
+
+    def __init__(self, path: str, lang: str):
+        self.lang = lang
+
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buffer = memoryview(self._mmap)
+        if buffer[:len(MAGIC)] != MAGIC:
+            buffer.release()
+            self._mmap.close()
+            raise ValueError(f"Arquivo de índice inválido: {path}")
+
+        self._size: int = buffer[len(MAGIC):HEADER_SIZE].cast("I")[0]
+
+        # Visões sem cópia de cada região do arquivo
+        start = HEADER_SIZE
+        self.letters = buffer[start:start + self._size * WORD_SIZE]
+        start += self._size * WORD_SIZE
+        self.masks = buffer[start:start + self._size * 4].cast("I")
+        start += self._size * 4
+        self.order = buffer[start:start + self._size * 4].cast("I")
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError(i)
+        return str(self.letters[i * WORD_SIZE:(i + 1) * WORD_SIZE], "ascii")
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield str(self.letters[i * WORD_SIZE:(i + 1) * WORD_SIZE], "ascii")
+
+    def __contains__(self, word: object) -> bool:
+        """ Verifica se a palavra está no índice por busca binária, em O(log n). """
+        if type(word) != str or len(word) != WORD_SIZE:
+            return False
+        sorted_words = _SortedView(self)
+        i = bisect_left(sorted_words, word)
+        return i < self._size and sorted_words[i] == word
+
+    def mask(self, i: int) -> int:
+        """ Retorna o bitset de letras da palavra de índice `i`. """
+        return self.masks[i]
+
+    def close(self):
+        """ Libera as visões e fecha o mapeamento do arquivo. """
+        for view in (self.letters, self.masks, self.order, self._buffer):
+            view.release()
+        self._mmap.close()
+
+
+def get_index_path(lang: str) -> str:
+    """ Retorna o caminho do arquivo de índice do idioma `lang`. """
+    return f"words_{lang}.idx"
+
+
+def build_index(lang: str, path: str | None = None) -> str:
+    """ Gera o arquivo de índice do idioma `lang` a partir de 'words_lang.txt'.
+
+    O arquivo é escrito em um temporário e depois renomeado, para que outros processos
+    nunca abram um índice incompleto.
+
+    Retorno
+        str: Caminho do arquivo gerado.
+    """
+    if path is None:
+        path = get_index_path(lang)
+
+    # Lê o arquivo diretamente, sem passar pelo cache de `utils.load_words`, para não manter
+    # a lista completa (com palavras de qualquer tamanho) em memória neste processo
+    with open(f"words_{lang}.txt", "r", encoding="utf-8") as file:
+        words = [line.strip().upper() for line in file]
+    words = [word for word in words if len(word) == WORD_SIZE and word.isascii()]
+
+    letters = "".join(words).encode("ascii")
+    masks = array("I", (sum(1 << (ord(letter) - ord("A")) for letter in set(word)) for word in words))
+    order = array("I", sorted(range(len(words)), key=lambda i: words[i]))
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(MAGIC)
+        file.write(array("I", [len(words)]).tobytes())
+        file.write(letters)
+        file.write(masks.tobytes())
+        file.write(order.tobytes())
+    os.replace(temp_path, path)
+
+    return path
+
+
+def open_index(lang: str | None = None) -> WordIndex:
+    """ Abre o índice do idioma `lang` (por padrão, o idioma global de `utils`).
+
+    O índice é gerado se ainda não existir ou se estiver desatualizado em relação ao
+    arquivo de palavras, e é aberto apenas uma vez por processo.
+    """
+    if lang is None:
+        lang = utils.language
+
+    if lang in _indexes:
+        return _indexes[lang]
+
+    path = get_index_path(lang)
+    source = f"words_{lang}.txt"
+    if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(source):
+        build_index(lang, path)
+
+    _indexes[lang] = WordIndex(path, lang)
+    return _indexes[lang]